@@ -3,7 +3,6 @@ WebCrawlScrape - Command Line Interface
 Usage: python cli.py <url> [options]
 """
 
-import argparse
 import sys
 from config import (
     DEFAULT_DOWNLOAD_DIR,
@@ -12,7 +11,6 @@ from config import (
     EXTENSION_PRESETS,
     parse_extensions,
 )
-from crawler import crawl
 
 
 def list_presets():
@@ -28,6 +26,20 @@ def list_presets():
 
 
 def main():
+    # Fast paths for the common trivial invocations - these skip the
+    # argparse import and parser build entirely
+    argv = sys.argv[1:]
+    if "--presets" in argv:
+        list_presets()
+        return 0
+    if not argv:
+        print("Usage: python cli.py <url> [options]")
+        print("Try 'python cli.py --help' for options, '--presets' for extension presets.")
+        print("\nError: URL is required")
+        return 1
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="WebCrawlScrape - Download files from websites",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -84,12 +96,7 @@ Examples:
 
     args = parser.parse_args()
 
-    # Show presets if requested
-    if args.presets:
-        list_presets()
-        sys.exit(0)
-
-    # URL is required unless showing presets
+    # URL is required (--presets is handled by the fast path above)
     if not args.url:
         parser.print_help()
         print("\nError: URL is required")
@@ -110,6 +117,9 @@ Examples:
     print("=" * 50)
     print()
 
+    # Import here so --presets/--help don't pay the requests/bs4 cost
+    from crawler import crawl
+
     # Run crawler
     try:
         stats = crawl(
@@ -13,25 +13,33 @@ DEFAULT_TIMEOUT = 15
 # -----------------------------
 # EXTENSION PRESETS
 # -----------------------------
+# Presets are frozensets: immutable, slightly leaner per element, and
+# safe to share with the crawler's hot `ext in allowed_exts` check
 EXTENSION_PRESETS = {
-    "images": {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".svg", ".ico"},
-    "documents": {".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt", ".xls", ".xlsx"},
-    "archives": {".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"},
-    "audio": {".mp3", ".wav", ".ogg", ".flac", ".m4a", ".aac"},
-    "video": {".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv"},
-    "code": {".py", ".js", ".html", ".css", ".json", ".xml", ".yaml", ".yml"},
-    "midi": {".mid", ".midi"},
-    "arc": {".zip", ".map", ".rec", ".png", ".jpg"},  # ARC-specific
-    "all": set(),  # Empty = match any extension
+    "images": frozenset({".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".svg", ".ico"}),
+    "documents": frozenset({".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt", ".xls", ".xlsx"}),
+    "archives": frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"}),
+    "audio": frozenset({".mp3", ".wav", ".ogg", ".flac", ".m4a", ".aac"}),
+    "video": frozenset({".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv"}),
+    "code": frozenset({".py", ".js", ".html", ".css", ".json", ".xml", ".yaml", ".yml"}),
+    "midi": frozenset({".mid", ".midi"}),
+    "arc": frozenset({".zip", ".map", ".rec", ".png", ".jpg"}),  # ARC-specific
+    "all": frozenset(),  # Empty = match any extension
 }
 
 # Default extensions if none specified
 DEFAULT_EXTENSIONS = EXTENSION_PRESETS["archives"] | EXTENSION_PRESETS["images"]
 
+# Static-asset extensions that are never crawlable pages; links to
+# these are dropped from the frontier unless explicitly downloadable
+NON_HTML_EXTENSIONS = frozenset({
+    ".css", ".js", ".ico", ".svg", ".woff", ".woff2", ".ttf", ".eot", ".map",
+})
+
 
 def get_extensions_from_preset(preset_name):
     """Get extension set from a preset name."""
-    return EXTENSION_PRESETS.get(preset_name.lower(), set())
+    return EXTENSION_PRESETS.get(preset_name.lower(), frozenset())
 
 
 def parse_extensions(ext_string):
@@ -44,7 +52,7 @@ def parse_extensions(ext_string):
         - Mixed: "images,.pdf,.doc"
 
     Returns:
-        Set of extensions (lowercase, with dots)
+        Frozenset of extensions (lowercase, with dots)
     """
     if not ext_string:
         return DEFAULT_EXTENSIONS
@@ -60,4 +68,4 @@ def parse_extensions(ext_string):
         elif part:
             result.add(f".{part}")
 
-    return result if result else DEFAULT_EXTENSIONS
+    return frozenset(result) if result else DEFAULT_EXTENSIONS
@@ -7,19 +7,83 @@ import os
 import re
 import time
 import hashlib
-import requests
-from bs4 import BeautifulSoup
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 from collections import deque
 
+# requests and bs4 are imported lazily inside the functions that need
+# them, so `python cli.py --help` does not pay their import cost
+
 from config import (
     DEFAULT_DOWNLOAD_DIR,
     DEFAULT_EXTENSIONS,
     DEFAULT_MAX_PAGES,
     DEFAULT_TIMEOUT,
+    NON_HTML_EXTENSIONS,
 )
 
+USER_AGENT = "WebCrawlScrape/1.0"
+
+# Worker threads for parallel file downloads
+DOWNLOAD_WORKERS = 8
+
+# Page fetches kept in flight ahead of parsing (only without a delay)
+PAGE_PREFETCH = 4
+
+# Page-progress lines buffered between stdout flushes; per-line writes
+# to a console are surprisingly slow (especially on Windows)
+PROGRESS_FLUSH = 32
+
+# Characters not allowed in saved-page filenames, compiled once so the
+# per-page save path skips the re cache lookup
+_PAGE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# HTML parser backend, chosen on first use (see _get_html_parser)
+_HTML_PARSER = None
+
+
+def _get_html_parser():
+    """
+    Pick the HTML parser backend on first use: the C-based lxml parser
+    when installed (several times faster on large pages), otherwise the
+    stdlib html.parser.
+    """
+    global _HTML_PARSER
+    if _HTML_PARSER is None:
+        try:
+            import lxml  # noqa: F401
+            _HTML_PARSER = "lxml"
+        except ImportError:
+            _HTML_PARSER = "html.parser"
+    return _HTML_PARSER
+
+
+# -----------------------------
+# HTTP SESSION
+# -----------------------------
+def make_session():
+    """
+    Create a requests.Session with connection pooling and keep-alive.
+    Reusing one session avoids a TCP/TLS handshake per request.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
 
 # -----------------------------
 # ROBOTS.TXT HANDLER
@@ -27,10 +91,11 @@ from config import (
 class RobotsChecker:
     """Handles robots.txt parsing and URL checking."""
 
-    def __init__(self, base_url, user_agent="WebCrawlScrape/1.0"):
+    def __init__(self, base_url, user_agent=USER_AGENT, log_callback=print):
         self.user_agent = user_agent
         self.parser = RobotFileParser()
         self.loaded = False
+        self._cache = {}  # path -> allowed verdict
 
         # Build robots.txt URL
         parsed = urlparse(base_url)
@@ -40,16 +105,25 @@ class RobotsChecker:
             self.parser.set_url(robots_url)
             self.parser.read()
             self.loaded = True
-            print(f"[ROBOTS] Loaded {robots_url}")
+            log_callback(f"[ROBOTS] Loaded {robots_url}")
         except Exception as e:
-            print(f"[ROBOTS] Could not load robots.txt: {e}")
+            log_callback(f"[ROBOTS] Could not load robots.txt: {e}")
             self.loaded = False
 
     def can_fetch(self, url):
         """Check if URL is allowed by robots.txt."""
         if not self.loaded:
             return True  # Allow if robots.txt not available
-        return self.parser.can_fetch(self.user_agent, url)
+
+        # RobotFileParser rescans its whole rule list per query, and the
+        # rules only look at path+query - so cache verdicts by that key
+        parsed = _urlparse_cached(url)
+        key = f"{parsed.path}?{parsed.query}" if parsed.query else (parsed.path or "/")
+        verdict = self._cache.get(key)
+        if verdict is None:
+            verdict = self.parser.can_fetch(self.user_agent, url)
+            self._cache[key] = verdict
+        return verdict
 
 
 # -----------------------------
@@ -60,38 +134,120 @@ class DuplicateDetector:
 
     def __init__(self):
         self.hashes = set()
+        self.prefix_hashes = set()  # (size, first-chunk digest) pairs
+        self._lock = threading.Lock()  # Downloads run on worker threads
 
     def is_duplicate(self, content):
         """Check if content hash already exists."""
-        file_hash = hashlib.md5(content).hexdigest()
-        if file_hash in self.hashes:
-            return True
-        self.hashes.add(file_hash)
-        return False
+        return self.is_duplicate_hash(hashlib.sha256(content).digest())
+
+    def is_duplicate_hash(self, file_hash):
+        """Check a precomputed content digest, recording it if new."""
+        with self._lock:
+            if file_hash in self.hashes:
+                return True
+            self.hashes.add(file_hash)
+            return False
+
+    def seen_prefix(self, size, first_chunk):
+        """
+        Cheap duplicate pre-check: Content-Length plus a hash of the
+        first chunk. Identical size + prefix is nearly collision-free
+        for real files, and lets a download be abandoned before the
+        whole body is fetched.
+
+        Read-only - record_prefix() commits the key once the file is
+        actually on disk, so a failed download never poisons the check.
+        """
+        key = (size, hashlib.sha256(first_chunk).digest())
+        with self._lock:
+            return key in self.prefix_hashes
+
+    def record_prefix(self, size, first_chunk):
+        """Record a (size, prefix) pair after a successful download."""
+        key = (size, hashlib.sha256(first_chunk).digest())
+        with self._lock:
+            self.prefix_hashes.add(key)
 
     def get_count(self):
         """Return number of unique files seen."""
-        return len(self.hashes)
+        with self._lock:
+            return len(self.hashes)
 
 
 # -----------------------------
 # HELPERS
 # -----------------------------
+# urlparse is pure but nontrivial, and the crawl loop hits the same
+# links repeatedly - memoize it so re-parses become dict hits
+_urlparse_cached = lru_cache(maxsize=4096)(urlparse)
+
+
 def is_same_domain(url, base_netloc):
     """Check if URL belongs to the same domain."""
-    return urlparse(url).netloc == base_netloc
+    return _urlparse_cached(url).netloc == base_netloc
 
 
 def get_extension(url):
     """Extract lowercase file extension from URL."""
-    path = urlparse(url).path
-    return os.path.splitext(path)[1].lower()
+    # Pure string scan: trim the query/fragment, find the last '.' in
+    # the final path segment. Skips urlparse and os.path.splitext,
+    # which matters in the per-link hot loop.
+    end = len(url)
+    q = url.find("?")
+    if q != -1:
+        end = q
+    frag = url.find("#")
+    if frag != -1 and frag < end:
+        end = frag
+
+    # Start after the netloc so domain dots never count as extensions
+    sep = url.find("://")
+    path_start = url.find("/", sep + 3) if sep != -1 else 0
+    if path_start == -1 or path_start >= end:
+        return ""
+
+    # A dot right after the slash is a dotfile ('.hidden'), which
+    # splitext treats as extensionless - require a character between
+    dot = url.rfind(".", path_start, end)
+    if dot == -1 or dot <= url.rfind("/", path_start, end) + 1:
+        return ""
+    return url[dot:end].lower()
+
+
+def fast_urljoin(page_url, base_root, base_dir, href):
+    """
+    Join an href against its page URL, special-casing the common forms
+    (absolute, root-relative, plain relative) with string concatenation.
+    Anything unusual falls back to the full RFC-3986 urljoin.
+    """
+    # Hrefs wrapped across source lines keep their tab/newline chars in
+    # the attribute value; urljoin strips those (WHATWG behaviour), so
+    # any whitespace routes to it. Checked before the absolute fast
+    # path, which would otherwise pass the garbage through verbatim.
+    if " " in href or "\t" in href or "\n" in href or "\r" in href:
+        return urljoin(page_url, href)
+    if href.startswith(("http://", "https://")):
+        return href
+    # '.' and empty segments anywhere need real normalization ('a/./b',
+    # '././x', 'x//y', trailing '/.'), or the same page gets enqueued
+    # under two spellings and fetched twice
+    if (not href or ".." in href or "//" in href
+            or href.startswith(("?", "#"))
+            or "/./" in href or href.endswith("/.") or href == "."
+            or ":" in href.split("/", 1)[0]):
+        return urljoin(page_url, href)
+    if href[0] == "/":
+        return base_root + href
+    if href.startswith("./"):
+        href = href[2:]
+    return base_root + base_dir + href
 
 
 def get_url_depth(url, base_url):
     """Calculate the depth of a URL relative to base URL."""
-    base_path = urlparse(base_url).path.rstrip('/')
-    url_path = urlparse(url).path.rstrip('/')
+    base_path = _urlparse_cached(base_url).path.rstrip('/')
+    url_path = _urlparse_cached(url).path.rstrip('/')
 
     # Remove base path from URL path
     if url_path.startswith(base_path):
@@ -104,12 +260,17 @@ def get_url_depth(url, base_url):
     return len(segments)
 
 
-def download_file(url, download_dir, timeout, duplicate_detector=None):
+def download_file(url, session, download_dir, timeout, duplicate_detector=None,
+                  existing=None, log_callback=print):
     """
     Download a file from URL to the specified directory.
-    Skips if file already exists or is a duplicate.
+    Skips if file already exists or is a duplicate. `existing` is an
+    optional set of filenames already in download_dir; when given it
+    replaces the per-file os.path.exists syscall and is updated after
+    each successful download.
     """
-    os.makedirs(download_dir, exist_ok=True)
+    if existing is None:
+        os.makedirs(download_dir, exist_ok=True)
 
     filename = os.path.basename(urlparse(url).path)
     if not filename:
@@ -117,30 +278,60 @@ def download_file(url, download_dir, timeout, duplicate_detector=None):
 
     path = os.path.join(download_dir, filename)
 
-    if os.path.exists(path):
-        print(f"[SKIP] {filename} (exists)")
+    already = filename in existing if existing is not None else os.path.exists(path)
+    if already:
+        log_callback(f"[SKIP] {filename} (exists)")
         return False, "exists"
 
+    tmp_path = None
     try:
-        r = requests.get(url, timeout=timeout, stream=True)
+        r = session.get(url, timeout=timeout, stream=True)
         r.raise_for_status()
 
-        # Read content for duplicate check
-        content = r.content
+        # Probe the first chunk before committing to the full download;
+        # a known (size, prefix) pair means we can skip the rest of the
+        # body entirely and save the bandwidth
+        chunks = r.iter_content(chunk_size=65536)
+        first_chunk = next(chunks, b"")
+        size = -1
+        if duplicate_detector:
+            size = int(r.headers.get("Content-Length", -1))
+            if duplicate_detector.seen_prefix(size, first_chunk):
+                r.close()
+                log_callback(f"[SKIP] {filename} (duplicate content)")
+                return False, "duplicate"
+
+        # Stream to a temp file, hashing as we go, so large files never
+        # sit fully in memory
+        file_hash = hashlib.sha256(first_chunk)
+        with tempfile.NamedTemporaryFile(dir=download_dir, delete=False) as tmp:
+            tmp_path = tmp.name
+            tmp.write(first_chunk)
+            for chunk in chunks:
+                file_hash.update(chunk)
+                tmp.write(chunk)
 
         # Check for duplicates
-        if duplicate_detector and duplicate_detector.is_duplicate(content):
-            print(f"[SKIP] {filename} (duplicate content)")
+        if duplicate_detector and duplicate_detector.is_duplicate_hash(file_hash.digest()):
+            os.unlink(tmp_path)
+            log_callback(f"[SKIP] {filename} (duplicate content)")
             return False, "duplicate"
 
-        with open(path, "wb") as f:
-            f.write(content)
-
-        print(f"[DOWNLOADED] {filename}")
+        os.replace(tmp_path, path)
+        if duplicate_detector:
+            # Committed only now: a failed download must not leave a
+            # prefix key behind, or later copies of the same content
+            # would be skipped without anything saved
+            duplicate_detector.record_prefix(size, first_chunk)
+        if existing is not None:
+            existing.add(filename)
+        log_callback(f"[DOWNLOADED] {filename}")
         return True, "success"
 
     except Exception as e:
-        print(f"[ERROR] {url} -> {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        log_callback(f"[ERROR] {url} -> {e}")
         return False, "error"
 
 
@@ -157,7 +348,9 @@ def crawl(
     delay=0,
     respect_robots=False,
     detect_duplicates=True,
-    save_pages=False
+    save_pages=False,
+    stop_event=None,
+    log_callback=print
 ):
     """
     Crawl starting from a URL, downloading files with matching extensions.
@@ -174,6 +367,11 @@ def crawl(
         respect_robots: Whether to respect robots.txt
         detect_duplicates: Whether to skip duplicate files by hash
         save_pages: Whether to save crawled webpages to html/ subfolder
+        stop_event: Optional threading.Event; set it to stop the crawl
+                    cooperatively between pages
+        log_callback: Called with each progress line; defaults to print.
+                      Embedders (like the GUI) pass their own sink here
+                      instead of redirecting sys.stdout
 
     Returns:
         dict with stats: pages_crawled, files_downloaded, errors, duplicates_skipped
@@ -189,8 +387,10 @@ def crawl(
         timeout = DEFAULT_TIMEOUT
 
     visited = set()
-    # Queue stores (url, depth) tuples
+    # Queue stores (url, depth) tuples; enqueued mirrors the queue so a
+    # URL linked from many pages is only ever appended once
     queue = deque([(start_url, 0)])
+    enqueued = {start_url}
     base_netloc = urlparse(start_url).netloc
 
     stats = {
@@ -205,61 +405,155 @@ def crawl(
     # Initialize robots.txt checker
     robots = None
     if respect_robots:
-        robots = RobotsChecker(start_url)
+        robots = RobotsChecker(start_url, log_callback=log_callback)
 
     # Initialize duplicate detector
     dup_detector = DuplicateDetector() if detect_duplicates else None
 
+    # Snapshot filenames already on disk once, so re-crawls skip
+    # downloads without a stat syscall per file
+    os.makedirs(out_dir, exist_ok=True)
+    existing = set(os.listdir(out_dir))
+
     # Create html subfolder if saving pages
     html_dir = None
     if save_pages:
         html_dir = os.path.join(out_dir, "html")
         os.makedirs(html_dir, exist_ok=True)
 
-    while queue and stats["pages_crawled"] < max_pages:
-        url, depth = queue.popleft()
+    # One pooled session for the whole crawl (keep-alive) plus a worker
+    # pool so file downloads overlap instead of running one at a time
+    session = make_session()
+    try:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            _crawl_loop(
+                session, pool, queue, visited, enqueued, base_netloc, stats,
+                allowed_exts, out_dir, max_pages, timeout, max_depth,
+                delay, robots, dup_detector, html_dir, existing, stop_event,
+                log_callback
+            )
+    finally:
+        session.close()
+
+    # Summary, assembled as one line so it reaches the sink in one call
+    summary = (f"\n[DONE] Pages: {stats['pages_crawled']}, "
+               f"Downloaded: {stats['files_downloaded']}, "
+               f"Errors: {stats['errors']}")
 
-        if url in visited:
-            continue
+    if save_pages:
+        summary += f", HTML saved: {stats['pages_saved']}"
+    if detect_duplicates:
+        summary += f", Duplicates skipped: {stats['duplicates_skipped']}"
+    if respect_robots:
+        summary += f", Robots blocked: {stats['robots_blocked']}"
+    log_callback(summary)
 
-        # Check max depth
-        if max_depth is not None and depth > max_depth:
-            continue
+    return stats
 
-        # Check robots.txt
-        if robots and not robots.can_fetch(url):
-            print(f"[ROBOTS] Blocked: {url}")
-            stats["robots_blocked"] += 1
-            continue
+
+def _crawl_loop(session, pool, queue, visited, enqueued, base_netloc, stats,
+                allowed_exts, out_dir, max_pages, timeout, max_depth,
+                delay, robots, dup_detector, html_dir, existing, stop_event,
+                log_callback):
+    """Inner crawl loop; shares one pooled session across all requests."""
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    html_parser = _get_html_parser()
+    # Only <a> and <img> tags are ever read, so skip building the rest
+    # of the DOM tree
+    link_strainer = SoupStrainer(["a", "img"])
+
+    # Local counters avoid a dict lookup + store per event in the hot
+    # loop; they are written back into stats when the loop finishes
+    pages = files = saved = errors = dups = blocked = 0
+
+    # Per-page progress lines are buffered and written in blocks; the
+    # buffer is flushed before any other output so ordering stays sane
+    progress = []
+
+    def flush_progress():
+        if progress:
+            log_callback("\n".join(progress))
+            progress.clear()
+
+    # Page fetches in flight on the worker pool: future -> (url, depth).
+    # With no rate limit a few fetches run ahead of parsing so the
+    # network stays busy; with a delay the window shrinks to one page.
+    prefetch = 1 if delay > 0 else PAGE_PREFETCH
+    in_flight = {}
+
+    def schedule_pages():
+        """Top up in-flight page fetches from the queue."""
+        nonlocal blocked
+        if stop_event is not None and stop_event.is_set():
+            return
+        while queue and len(in_flight) < prefetch:
+            if pages + len(in_flight) >= max_pages:
+                break
+            url, depth = queue.popleft()
+
+            # Check max depth
+            if max_depth is not None and depth > max_depth:
+                continue
+
+            # Check robots.txt
+            if robots and not robots.can_fetch(url):
+                flush_progress()
+                log_callback(f"[ROBOTS] Blocked: {url}")
+                blocked += 1
+                continue
+
+            # Rate limiting
+            if delay > 0 and pages > 0:
+                time.sleep(delay)
+
+            in_flight[pool.submit(session.get, url, timeout=timeout)] = (url, depth)
+
+    schedule_pages()
+    while in_flight:
+        # Cooperative cancellation: Event.is_set() is an atomic C-level
+        # read, cheap enough to poll once per page
+        if stop_event is not None and stop_event.is_set():
+            for future in in_flight:
+                future.cancel()
+            flush_progress()
+            log_callback("[STOPPED] Crawl cancelled")
+            break
+
+        # Process whichever page fetch finishes first
+        future = next(as_completed(in_flight))
+        url, depth = in_flight.pop(future)
 
         visited.add(url)
-        stats["pages_crawled"] += 1
+        pages += 1
 
         depth_str = f" (depth {depth})" if max_depth is not None else ""
-        print(f"[PAGE {stats['pages_crawled']}/{max_pages}]{depth_str} {url}")
-
-        # Rate limiting
-        if delay > 0 and stats["pages_crawled"] > 1:
-            time.sleep(delay)
+        progress.append(f"[PAGE {pages}/{max_pages}]{depth_str} {url}")
+        if len(progress) >= PROGRESS_FLUSH:
+            flush_progress()
 
         try:
-            r = requests.get(url, timeout=timeout)
+            r = future.result()
             r.raise_for_status()
         except Exception as e:
-            print(f"[ERROR] {url} -> {e}")
-            stats["errors"] += 1
+            flush_progress()
+            log_callback(f"[ERROR] {url} -> {e}")
+            errors += 1
+            schedule_pages()
             continue
 
-        soup = BeautifulSoup(r.text, "html.parser")
+        # Parse from bytes so BeautifulSoup decodes once, not twice
+        soup = BeautifulSoup(r.content, html_parser, parse_only=link_strainer)
 
         # Save webpage if enabled
         if html_dir:
+            flush_progress()
             try:
                 # Generate filename from URL path
                 parsed_url = urlparse(url)
                 page_path = parsed_url.path.strip('/') or 'index'
                 # Clean filename
-                page_filename = re.sub(r'[<>:"/\\|?*]', '_', page_path)
+                page_filename = _PAGE_FILENAME_RE.sub('_', page_path)
                 if not page_filename.endswith(('.html', '.htm')):
                     page_filename += '.html'
 
@@ -269,20 +563,33 @@ def crawl(
                 if not os.path.exists(page_filepath):
                     with open(page_filepath, 'w', encoding='utf-8') as f:
                         f.write(r.text)
-                    print(f"[SAVED] {page_filename}")
-                    stats["pages_saved"] += 1
+                    log_callback(f"[SAVED] {page_filename}")
+                    saved += 1
             except Exception as e:
-                print(f"[SAVE ERROR] {url} -> {e}")
+                log_callback(f"[SAVE ERROR] {url} -> {e}")
 
         # Collect all potential file URLs
         file_urls = set()
 
+        # Precompute join bases once per page so common hrefs skip the
+        # full urljoin machinery
+        page_parsed = _urlparse_cached(url)
+        base_root = f"{page_parsed.scheme}://{page_parsed.netloc}"
+        page_path = page_parsed.path
+        base_dir = page_path[:page_path.rfind("/") + 1] or "/"
+
         # Check anchor tags
         for tag in soup.find_all("a", href=True):
-            link = urljoin(url, tag["href"])
-            link = link.split("#")[0]  # Remove fragment
+            href = tag["href"]
 
-            if not link or link in visited:
+            # Skip non-HTTP schemes before paying for a join
+            if href.startswith(("mailto:", "tel:", "javascript:")):
+                continue
+
+            link = fast_urljoin(url, base_root, base_dir, href)
+            link = link.split("#", 1)[0]  # Remove fragment
+
+            if not link or link in enqueued:
                 continue
 
             ext = get_extension(link)
@@ -292,45 +599,74 @@ def crawl(
                 file_urls.add(link)
                 continue
 
+            # Static assets are neither downloads nor pages - keep them
+            # out of the frontier and the enqueued set
+            if ext in NON_HTML_EXTENSIONS:
+                continue
+
             # Is it a page to crawl?
-            if is_same_domain(link, base_netloc) and link not in visited:
+            if is_same_domain(link, base_netloc):
                 new_depth = depth + 1
                 if max_depth is None or new_depth <= max_depth:
+                    enqueued.add(link)
                     queue.append((link, new_depth))
 
         # Check img tags for images
         for img in soup.find_all("img", src=True):
-            link = urljoin(url, img["src"])
+            link = fast_urljoin(url, base_root, base_dir, img["src"])
             ext = get_extension(link)
             if ext and (not allowed_exts or ext in allowed_exts):
                 file_urls.add(link)
 
+        # Top up page fetches before blocking on file downloads
+        schedule_pages()
+
         # Download collected files
-        for file_url in file_urls:
-            # Rate limiting for downloads too
-            if delay > 0:
+        if file_urls:
+            flush_progress()
+        if delay > 0:
+            # Rate limiting keeps downloads sequential
+            for file_url in file_urls:
                 time.sleep(delay / 2)  # Half delay for files
-
-            success, reason = download_file(file_url, out_dir, timeout, dup_detector)
-            if success:
-                stats["files_downloaded"] += 1
-            elif reason == "duplicate":
-                stats["duplicates_skipped"] += 1
-
-    # Summary
-    print(f"\n[DONE] Pages: {stats['pages_crawled']}, "
-          f"Downloaded: {stats['files_downloaded']}, "
-          f"Errors: {stats['errors']}", end="")
-
-    if save_pages:
-        print(f", HTML saved: {stats['pages_saved']}", end="")
-    if detect_duplicates:
-        print(f", Duplicates skipped: {stats['duplicates_skipped']}", end="")
-    if respect_robots:
-        print(f", Robots blocked: {stats['robots_blocked']}", end="")
-    print()
-
-    return stats
+                success, reason = download_file(file_url, session, out_dir, timeout,
+                                                dup_detector, existing, log_callback)
+                if success:
+                    files += 1
+                elif reason == "duplicate":
+                    dups += 1
+        elif file_urls:
+            # Distinct URLs can share a basename; submitting both would
+            # race past the exists check and the second os.replace would
+            # silently overwrite the first. Keep the first per filename,
+            # matching the sequential loop's skip behaviour.
+            names = set()
+            futures = []
+            for file_url in file_urls:
+                name = os.path.basename(_urlparse_cached(file_url).path)
+                if name in names:
+                    log_callback(f"[SKIP] {name} (exists)")
+                    continue
+                names.add(name)
+                futures.append(
+                    pool.submit(download_file, file_url, session, out_dir,
+                                timeout, dup_detector, existing, log_callback)
+                )
+            for future in as_completed(futures):
+                success, reason = future.result()
+                if success:
+                    files += 1
+                elif reason == "duplicate":
+                    dups += 1
+
+    flush_progress()
+    stats.update(
+        pages_crawled=pages,
+        files_downloaded=files,
+        pages_saved=saved,
+        errors=errors,
+        duplicates_skipped=dups,
+        robots_blocked=blocked,
+    )
 
 
 # -----------------------------
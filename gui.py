@@ -4,21 +4,183 @@ Tkinter interface for the web crawler.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, scrolledtext
+from tkinter import ttk  # filedialog/scrolledtext imported lazily at use
 import threading
+import queue
 import os
-import sys
+from contextlib import contextmanager
+from functools import lru_cache
 import re
+import sys
 import json
 from urllib.parse import urlparse
 
 from config import EXTENSION_PRESETS, DEFAULT_MAX_PAGES
-from crawler import crawl
 from version import VERSION
 
+# orjson (C extension) serializes several times faster than stdlib json;
+# it is optional, so fall back quietly when not installed. Both paths
+# produce/consume bytes so file handling stays uniform.
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+    _json_loads = json.loads
+
 # Config file for saving custom categories
 CUSTOM_CATEGORIES_FILE = os.path.join(os.path.dirname(__file__), "custom_categories.json")
 
+# Default download location; getcwd() is a syscall, so pay it once at
+# import rather than per CrawlerGUI instance
+_DEFAULT_DOWNLOAD_DIR = os.path.join(os.getcwd(), "downloads")
+
+# Folder-name patterns, compiled once - these run on every keystroke in
+# the URL entry via the folder-preview trace
+_ARCHIVE_RE = re.compile(r'https?://web\.archive\.org/web/\d+/(.+)')
+_EXT_RE = re.compile(r'\.[a-zA-Z0-9]+$')
+_DASHES_RE = re.compile(r'-+')
+_ARCHIVE_STRIP_RE = re.compile(r'[.\-_/]')
+
+# TLD suffixes stripped from archived domains; two-segment suffixes are
+# probed before single-segment ones so 'co.uk' can never lose to 'uk'
+_TLDS_1 = frozenset({'com', 'net', 'org', 'edu', 'gov', 'io', 'info'})
+_TLDS_2 = frozenset({'co.uk'})
+
+# Invalid filename chars map to dashes via str.translate - a tight
+# C-level loop, cheaper than a regex pass over the same string
+_INVALID_TABLE = str.maketrans({c: '-' for c in './<>:"\\|?*'})
+
+# Splits user-typed extension lists on commas and/or whitespace
+_EXT_SPLIT = re.compile(r'[,\s]+')
+
+# Log scrollback bound: once past the max, trim back down to the keep
+# count so appends stay O(1) no matter how long the crawl runs
+_LOG_MAX_LINES = 5000
+_LOG_KEEP_LINES = 4000
+
+
+def _parse_ext_list(text):
+    """
+    Parse a user-typed extension list into a set of '.ext' strings.
+
+    Extensions are interned: they recur as dict/set keys all over the
+    GUI, so one shared copy per spelling keeps hashing and equality on
+    the identity fast path.
+    """
+    return {
+        sys.intern(t if t.startswith('.') else '.' + t)
+        for t in _EXT_SPLIT.split(text.strip().lower())
+        if t
+    }
+
+
+@lru_cache(maxsize=64)
+def _sorted_exts(ext_set):
+    """Sorted tuple for a frozenset of extensions, cached per set."""
+    return tuple(sorted(ext_set))
+
+
+# URL -> folder-name mapping is deterministic, so both helpers are
+# cached - the preview trace and start_crawl repeatedly ask about the
+# same URL
+@lru_cache(maxsize=128)
+def _site_folder_name(url):
+    """
+    Extract a clean folder name from URL.
+    Example: www.abc.com/1/2/3/4.html -> abc-com-1-2-3-4
+    Archive: web.archive.org/web/20001018021550/http://arc.won.net/ -> arcwon
+    """
+    # Handle web.archive.org URLs specially
+    archive_match = _ARCHIVE_RE.match(url)
+    if archive_match:
+        original_url = archive_match.group(1)
+        return _archive_folder_name(original_url)
+
+    # Standard URL handling
+    parsed = urlparse(url)
+    domain = parsed.netloc
+    path = parsed.path
+
+    # Remove www. prefix
+    if domain.startswith("www."):
+        domain = domain[4:]
+
+    # Remove file extension from path
+    if path:
+        # Remove leading slash and file extension
+        path = path.lstrip("/")
+        path = _EXT_RE.sub('', path)
+
+    # Combine domain and path
+    full_name = domain
+    if path:
+        full_name = f"{domain}/{path}"
+
+    # Replace dots, slashes, and invalid chars with dashes
+    folder_name = full_name.translate(_INVALID_TABLE)
+
+    # Clean up multiple dashes and trailing dashes
+    folder_name = _DASHES_RE.sub('-', folder_name)
+    folder_name = folder_name.strip('-')
+
+    return folder_name
+
+
+@lru_cache(maxsize=128)
+def _archive_folder_name(original_url):
+    """
+    Extract folder name from archived original URL.
+    Example: http://arc.won.net/guide/ -> arcwonguide
+    """
+    # Parse the original URL
+    if not original_url.startswith(('http://', 'https://')):
+        original_url = 'http://' + original_url
+
+    parsed = urlparse(original_url)
+    domain = parsed.netloc
+    path = parsed.path
+
+    # Remove www. prefix
+    if domain.startswith("www."):
+        domain = domain[4:]
+
+    # Remove common TLDs - one or two hash probes instead of a linear
+    # endswith scan
+    parts = domain.rsplit('.', 2)
+    if len(parts) == 3 and f"{parts[1]}.{parts[2]}" in _TLDS_2:
+        domain = parts[0]
+    elif len(parts) >= 2 and parts[-1] in _TLDS_1:
+        domain = domain[:-(len(parts[-1]) + 1)]
+
+    # Clean path - remove leading/trailing slashes and file extensions
+    if path:
+        path = path.strip('/')
+        path = _EXT_RE.sub('', path)  # Remove file extension
+
+    # Combine domain and path
+    full_name = domain
+    if path:
+        full_name = f"{domain}/{path}"
+
+    # Remove all dots, dashes, slashes - join as one word
+    folder_name = _ARCHIVE_STRIP_RE.sub('', full_name)
+
+    return folder_name if folder_name else "archive"
+
+
+def _block_key(event):
+    """Swallow typing in the log widget but let copy shortcuts through."""
+    if event.state & 0x4 and event.keysym.lower() in ("c", "a"):  # Ctrl+C/A
+        return None
+    return "break"
+
 
 class CrawlerGUI:
     def __init__(self, root):
@@ -28,13 +190,36 @@ class CrawlerGUI:
         self.root.resizable(True, True)
 
         self.is_crawling = False
-        self.ext_checkboxes = {}  # Store extension checkbox variables
+        # Cooperative stop flag; the crawler polls it between pages
+        self._stop_event = threading.Event()
+        self._preview_after_id = None  # Pending debounced preview update
+        self._last_preview_url = None  # URL the preview was last computed for
+        self.ext_checkboxes = {}  # Extension checkbox variables (visual state)
+        # Python-side checked state; reading a tk.BooleanVar is a Tcl
+        # roundtrip per call, so logic consults this dict instead
+        self.ext_state = {}
+        self._ext_pool = []  # Reusable (BooleanVar, Checkbutton) pairs
+        self._rendered_exts = None  # Extension tuple currently laid out
         self.category_vars = {}  # Store category checkbox variables
         self.custom_categories = {}  # Store custom categories {name: set of extensions}
         self.category_additions = {}  # Store user additions to built-in categories {name: set}
+        # Per-category preset|additions|custom unions, rebuilt lazily
+        # when category contents change
+        self._merged_category_exts = None
+        # Crawler log lines are queued here and drained in batches so a
+        # chatty crawl doesn't flood the Tk event loop
+        self.log_queue = queue.Queue(maxsize=1000)
+        self._log_lines = 0  # Lines currently in the log widget
+        self._save_after_id = None  # Pending debounced category save
+        # Dialogs are built on first use and then hidden/re-shown;
+        # rebuilding a Toplevel per click is the expensive part
+        self._add_cat_dialog = None
+        self._save_cat_dialog = None
         self.load_custom_categories()
         self.create_widgets()
         self.load_custom_category_checkboxes()
+        self.root.after(100, self._drain_log)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def create_widgets(self):
         # Main frame with padding
@@ -126,6 +311,9 @@ class CrawlerGUI:
         self.checkbox_frame.bind("<Configure>", self.on_checkbox_frame_configure)
         self.checkbox_canvas.bind("<Configure>", lambda e: self.checkbox_canvas.itemconfig(self.checkbox_window, width=e.width))
 
+        # Shared placeholder label for the "no extensions" states
+        self._ext_placeholder = ttk.Label(self.checkbox_frame, foreground="gray")
+
         # Initialize checkboxes for default selection
         self.update_extension_checkboxes()
 
@@ -147,7 +335,7 @@ class CrawlerGUI:
         dir_inner = ttk.Frame(dir_frame)
         dir_inner.pack(fill=tk.X, padx=5, pady=5)
 
-        self.dir_var = tk.StringVar(value=os.path.join(os.getcwd(), "downloads"))
+        self.dir_var = tk.StringVar(value=_DEFAULT_DOWNLOAD_DIR)
         self.dir_entry = ttk.Entry(dir_inner, textvariable=self.dir_var, width=50)
         self.dir_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
@@ -160,7 +348,7 @@ class CrawlerGUI:
             dir_frame,
             text="Create subfolder from URL:",
             variable=self.organize_by_site_var,
-            command=self.update_folder_preview
+            command=self._on_organize_toggle
         )
         organize_cb.pack(anchor=tk.W, padx=5, pady=(0, 2))
 
@@ -177,8 +365,11 @@ class CrawlerGUI:
         )
         self.folder_preview_label.pack(side=tk.LEFT, padx=5)
 
-        # Bind URL entry to update preview
-        self.url_var.trace_add("write", lambda *args: self.update_folder_preview())
+        # Bind URL entry to update preview (debounced); the trace is
+        # detached while the organize checkbox is off so typing costs
+        # nothing when no preview is wanted
+        self._url_trace_name = self.url_var.trace_add(
+            "write", lambda *args: self._schedule_preview_update())
 
         # --- Options Section ---
         opts_frame = ttk.LabelFrame(main_frame, text="Options", padding="5")
@@ -189,14 +380,14 @@ class CrawlerGUI:
         opts_row1.pack(fill=tk.X, padx=5, pady=2)
 
         ttk.Label(opts_row1, text="Max pages:").pack(side=tk.LEFT)
-        self.max_pages_var = tk.StringVar(value=str(DEFAULT_MAX_PAGES))
+        self.max_pages_var = tk.IntVar(value=DEFAULT_MAX_PAGES)
         ttk.Spinbox(
             opts_row1, from_=1, to=9999,
             textvariable=self.max_pages_var, width=6
         ).pack(side=tk.LEFT, padx=(5, 20))
 
         ttk.Label(opts_row1, text="Max depth:").pack(side=tk.LEFT)
-        self.max_depth_var = tk.StringVar(value="0")
+        self.max_depth_var = tk.IntVar(value=0)
         ttk.Spinbox(
             opts_row1, from_=0, to=99,
             textvariable=self.max_depth_var, width=4
@@ -208,7 +399,7 @@ class CrawlerGUI:
         opts_row2.pack(fill=tk.X, padx=5, pady=2)
 
         ttk.Label(opts_row2, text="Delay between requests:").pack(side=tk.LEFT)
-        self.delay_var = tk.StringVar(value="0.0")
+        self.delay_var = tk.DoubleVar(value=0.0)
         ttk.Spinbox(
             opts_row2, from_=0.0, to=10.0, increment=0.1,
             textvariable=self.delay_var, width=5
@@ -254,46 +445,116 @@ class CrawlerGUI:
         log_frame = ttk.LabelFrame(main_frame, text="Log", padding="5")
         log_frame.pack(fill=tk.BOTH, expand=True)
 
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, state=tk.DISABLED)
+        # Imported here rather than at module top - the extra Tcl package
+        # load would otherwise delay first paint of the window
+        from tkinter import scrolledtext
+
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=10)
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+        # Read-only via a key binding rather than state=DISABLED: the
+        # widget stays NORMAL so appends skip the two config() roundtrips
+        # per batch, and text stays selectable/copyable
+        self.log_text.bind("<Key>", _block_key)
+
+        # Cache bound methods once - the drain timer calls these for the
+        # life of the window, so skip the per-call attribute lookups
+        self._log_insert = self.log_text.insert
+        self._log_see = self.log_text.see
+
     def on_checkbox_frame_configure(self, event):
         self.checkbox_canvas.configure(scrollregion=self.checkbox_canvas.bbox("all"))
 
-    def update_extension_checkboxes(self):
-        # Clear existing checkboxes
-        for widget in self.checkbox_frame.winfo_children():
-            widget.destroy()
+    @contextmanager
+    def _batch_checkbox_updates(self):
+        """
+        Suspend the frame's <Configure> handler while many checkboxes
+        are (un)gridded, then recompute the scrollregion once instead of
+        once per geometry change.
+        """
+        self.checkbox_frame.unbind("<Configure>")
+        try:
+            yield
+        finally:
+            self.checkbox_frame.bind("<Configure>", self.on_checkbox_frame_configure)
+            self.checkbox_canvas.configure(scrollregion=self.checkbox_canvas.bbox("all"))
+
+    def _show_ext_placeholder(self, text):
+        """Hide all pooled checkboxes and show a gray placeholder."""
+        with self._batch_checkbox_updates():
+            for var, cb in self._ext_pool:
+                cb.grid_remove()
+            self._ext_placeholder.config(text=text)
+            self._ext_placeholder.grid(row=0, column=0, sticky=tk.W)
         self.ext_checkboxes.clear()
+        self.ext_state.clear()
+        self._rendered_exts = None
+
+    def update_extension_checkboxes(self):
+        # Checkbuttons are pooled and reconfigured rather than destroyed
+        # and recreated - Tk widget construction is far more expensive
+        # than a configure + re-grid
 
         # Check if "All Files" is selected
         if self.all_files_var.get():
-            ttk.Label(self.checkbox_frame, text="(All file types)", foreground="gray").grid(row=0, column=0, sticky=tk.W)
+            self._show_ext_placeholder("(All file types)")
             return
 
-        # Collect extensions from all selected categories
+        # Collect extensions from all selected categories; the preset/
+        # additions/custom unions are precomputed per category
+        merged = self._merged_category_exts
+        if merged is None:
+            merged = self._merged_category_exts = {
+                cat: (frozenset(EXTENSION_PRESETS.get(cat, ()))
+                      | frozenset(self.category_additions.get(cat, ()))
+                      | frozenset(self.custom_categories.get(cat, ())))
+                for cat in self.category_vars
+            }
+
         extensions = set()
         for cat, var in self.category_vars.items():
             if var.get():
-                # Built-in category extensions
-                extensions |= EXTENSION_PRESETS.get(cat, set())
-                # User additions to built-in categories
-                extensions |= self.category_additions.get(cat, set())
-                # Custom category extensions
-                extensions |= self.custom_categories.get(cat, set())
+                extensions |= merged.get(cat, frozenset())
 
         if not extensions:
-            ttk.Label(self.checkbox_frame, text="(Select a category)", foreground="gray").grid(row=0, column=0, sticky=tk.W)
+            self._show_ext_placeholder("(Select a category)")
+            return
+
+        # Toggling back to a selection seen before reuses its sort
+        sorted_exts = _sorted_exts(frozenset(extensions))
+
+        # Same extensions already on screen: nothing to lay out, and the
+        # user's per-extension checks survive the no-op category change
+        if sorted_exts == self._rendered_exts:
             return
 
-        # Create checkboxes in grid layout (3 columns)
-        sorted_exts = sorted(extensions)
-        cols = 3
-        for i, ext in enumerate(sorted_exts):
+        self.ext_checkboxes.clear()
+        self.ext_state.clear()
+
+        # Grow the pool if this selection needs more checkbuttons
+        while len(self._ext_pool) < len(sorted_exts):
             var = tk.BooleanVar(value=True)
-            self.ext_checkboxes[ext] = var
-            cb = ttk.Checkbutton(self.checkbox_frame, text=ext, variable=var, width=8)
-            cb.grid(row=i // cols, column=i % cols, sticky=tk.W, padx=2, pady=1)
+            cb = ttk.Checkbutton(self.checkbox_frame, variable=var, width=8)
+            self._ext_pool.append((var, cb))
+
+        with self._batch_checkbox_updates():
+            self._ext_placeholder.grid_remove()
+
+            # Lay out checkboxes in grid layout (3 columns)
+            cols = 3
+            for i, ext in enumerate(sorted_exts):
+                var, cb = self._ext_pool[i]
+                var.set(True)
+                cb.configure(text=ext, command=lambda e=ext: self._toggle_ext(e))
+                cb.grid(row=i // cols, column=i % cols, sticky=tk.W, padx=2, pady=1)
+                self.ext_checkboxes[ext] = var
+                self.ext_state[ext] = True
+
+            # Hide the surplus
+            for var, cb in self._ext_pool[len(sorted_exts):]:
+                cb.grid_remove()
+
+        self._rendered_exts = sorted_exts
 
     def on_category_change(self):
         """Called when any category checkbox changes."""
@@ -310,19 +571,27 @@ class CrawlerGUI:
                 var.set(False)
         self.update_extension_checkboxes()
 
-    def add_custom_category(self):
-        """Open dialog to add a custom category."""
-        dialog = tk.Toplevel(self.root)
+    def _show_dialog(self, dialog, width, height):
+        """Center a cached dialog over the main window and show it."""
+        x = self.root.winfo_x() + (self.root.winfo_width() - width) // 2
+        y = self.root.winfo_y() + (self.root.winfo_height() - height) // 2
+        dialog.geometry(f"+{x}+{y}")
+        dialog.deiconify()
+        dialog.grab_set()
+
+    @staticmethod
+    def _hide_dialog(dialog):
+        """Hide a cached dialog instead of destroying it."""
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def _build_add_cat_dialog(self):
+        """Build the Add Custom Category dialog (once)."""
+        dialog = self._add_cat_dialog = tk.Toplevel(self.root)
         dialog.title("Add Custom Category")
         dialog.geometry("350x150")
         dialog.transient(self.root)
-        dialog.grab_set()
-
-        # Center the dialog
-        dialog.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - 350) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - 150) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
 
         frame = ttk.Frame(dialog, padding="10")
         frame.pack(fill=tk.BOTH, expand=True)
@@ -331,54 +600,52 @@ class CrawlerGUI:
         name_row = ttk.Frame(frame)
         name_row.pack(fill=tk.X, pady=5)
         ttk.Label(name_row, text="Name:").pack(side=tk.LEFT)
-        name_var = tk.StringVar()
-        name_entry = ttk.Entry(name_row, textvariable=name_var, width=25)
-        name_entry.pack(side=tk.LEFT, padx=(10, 0))
+        self._add_cat_name_var = tk.StringVar()
+        self._add_cat_name_entry = ttk.Entry(name_row, textvariable=self._add_cat_name_var, width=25)
+        self._add_cat_name_entry.pack(side=tk.LEFT, padx=(10, 0))
 
         # Extensions entry
         ext_row = ttk.Frame(frame)
         ext_row.pack(fill=tk.X, pady=5)
         ttk.Label(ext_row, text="Extensions:").pack(side=tk.LEFT)
-        ext_var = tk.StringVar()
-        ext_entry = ttk.Entry(ext_row, textvariable=ext_var, width=25)
-        ext_entry.pack(side=tk.LEFT, padx=(10, 0))
+        self._add_cat_ext_var = tk.StringVar()
+        ttk.Entry(ext_row, textvariable=self._add_cat_ext_var, width=25).pack(side=tk.LEFT, padx=(10, 0))
         ttk.Label(frame, text="(comma separated, e.g. .dat,.bin,.sav)", foreground="gray").pack(anchor=tk.W)
 
-        def save_category():
-            name = name_var.get().strip().lower()
-            exts = ext_var.get().strip()
-
-            if not name:
-                return
-            if name in EXTENSION_PRESETS or name in self.custom_categories:
-                # Name already exists
-                return
-
-            # Parse extensions
-            ext_set = set()
-            for ext in exts.split(","):
-                ext = ext.strip().lower()
-                if ext and not ext.startswith("."):
-                    ext = "." + ext
-                if ext:
-                    ext_set.add(ext)
-
-            if not ext_set:
-                return
-
-            # Add custom category
-            self.custom_categories[name] = ext_set
-            self.add_custom_category_checkbox(name)
-            self.save_custom_categories()
-            dialog.destroy()
-
         # Buttons
         btn_row = ttk.Frame(frame)
         btn_row.pack(fill=tk.X, pady=(15, 0))
-        ttk.Button(btn_row, text="Add", command=save_category).pack(side=tk.LEFT)
-        ttk.Button(btn_row, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Button(btn_row, text="Add", command=self._add_cat_save).pack(side=tk.LEFT)
+        ttk.Button(btn_row, text="Cancel",
+                   command=lambda: self._hide_dialog(dialog)).pack(side=tk.LEFT, padx=(10, 0))
 
-        name_entry.focus_set()
+    def _add_cat_save(self):
+        name = sys.intern(self._add_cat_name_var.get().strip().lower())
+
+        if not name:
+            return
+        if name in EXTENSION_PRESETS or name in self.custom_categories:
+            # Name already exists
+            return
+
+        ext_set = _parse_ext_list(self._add_cat_ext_var.get())
+        if not ext_set:
+            return
+
+        # Add custom category
+        self.custom_categories[name] = ext_set
+        self.add_custom_category_checkbox(name)
+        self.save_custom_categories()
+        self._hide_dialog(self._add_cat_dialog)
+
+    def add_custom_category(self):
+        """Open dialog to add a custom category."""
+        if self._add_cat_dialog is None:
+            self._build_add_cat_dialog()
+        self._add_cat_name_var.set("")
+        self._add_cat_ext_var.set("")
+        self._show_dialog(self._add_cat_dialog, 350, 150)
+        self._add_cat_name_entry.focus_set()
 
     def add_custom_category_checkbox(self, name, auto_check=True):
         """Add a checkbox for a custom category."""
@@ -387,6 +654,7 @@ class CrawlerGUI:
 
         var = tk.BooleanVar(value=auto_check)
         self.category_vars[name] = var
+        self._invalidate_merged()
 
         cb = ttk.Checkbutton(
             row, text=name.capitalize(),
@@ -402,6 +670,7 @@ class CrawlerGUI:
         def remove_cat():
             del self.custom_categories[name]
             del self.category_vars[name]
+            self._invalidate_merged()
             row.destroy()
             self.save_custom_categories()
             self.update_extension_checkboxes()
@@ -411,24 +680,42 @@ class CrawlerGUI:
         # Update extensions display
         self.update_extension_checkboxes()
 
+    def _invalidate_merged(self):
+        """Category contents changed; drop the merged-extension cache."""
+        self._merged_category_exts = None
+
+    def _toggle_ext(self, ext):
+        """Checkbutton command: mirror the click into the state dict."""
+        self.ext_state[ext] = not self.ext_state[ext]
+
     def select_all_exts(self):
-        for var in self.ext_checkboxes.values():
+        for ext, var in self.ext_checkboxes.items():
+            self.ext_state[ext] = True
             var.set(True)
 
     def clear_all_exts(self):
-        for var in self.ext_checkboxes.values():
+        for ext, var in self.ext_checkboxes.items():
+            self.ext_state[ext] = False
             var.set(False)
 
     def load_custom_categories(self):
         """Load custom categories from JSON file."""
         if os.path.exists(CUSTOM_CATEGORIES_FILE):
             try:
-                with open(CUSTOM_CATEGORIES_FILE, 'r') as f:
-                    data = json.load(f)
-                    # Convert lists back to sets
-                    self.custom_categories = {k: set(v) for k, v in data.get('custom', {}).items()}
-                    self.category_additions = {k: set(v) for k, v in data.get('additions', {}).items()}
-            except (json.JSONDecodeError, IOError):
+                with open(CUSTOM_CATEGORIES_FILE, 'rb') as f:
+                    data = _json_loads(f.read())
+                # Convert lists back to sets, interning the strings so
+                # loaded extensions share storage with parsed ones
+                self.custom_categories = {
+                    sys.intern(k): {sys.intern(e) for e in v}
+                    for k, v in data.get('custom', {}).items()
+                }
+                self.category_additions = {
+                    sys.intern(k): {sys.intern(e) for e in v}
+                    for k, v in data.get('additions', {}).items()
+                }
+                self._invalidate_merged()
+            except (ValueError, IOError):
                 pass
 
     def load_custom_category_checkboxes(self):
@@ -437,220 +724,225 @@ class CrawlerGUI:
             self.add_custom_category_checkbox(name, auto_check=False)
 
     def save_custom_categories(self):
+        """
+        Schedule a category save. Consecutive edits within half a second
+        coalesce into one file write, and the write happens outside the
+        click handler that triggered it.
+        """
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._save_custom_categories_now)
+
+    def _save_custom_categories_now(self):
         """Save custom categories to JSON file."""
+        self._save_after_id = None
         data = {
-            'custom': {k: sorted(list(v)) for k, v in self.custom_categories.items()},
-            'additions': {k: sorted(list(v)) for k, v in self.category_additions.items() if v}
+            'custom': {k: sorted(v) for k, v in self.custom_categories.items()},
+            'additions': {k: sorted(v) for k, v in self.category_additions.items() if v}
         }
+        # Write to a sibling temp file and rename over the target;
+        # os.replace is atomic, so a crash mid-write can never leave a
+        # truncated file for load_custom_categories to discard
+        tmp = CUSTOM_CATEGORIES_FILE + '.tmp'
         try:
-            with open(CUSTOM_CATEGORIES_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(tmp, 'wb') as f:
+                f.write(_json_dumps(data))
+            os.replace(tmp, CUSTOM_CATEGORIES_FILE)
         except IOError:
             pass
 
-    def save_extensions_to_category(self):
-        """Open dialog to save extensions to a category."""
-        exts_text = self.custom_ext_var.get().strip()
-        if not exts_text:
-            return
-
-        # Parse extensions
-        new_exts = set()
-        for ext in exts_text.split(","):
-            ext = ext.strip().lower()
-            if ext and not ext.startswith("."):
-                ext = "." + ext
-            if ext:
-                new_exts.add(ext)
-
-        if not new_exts:
-            return
-
-        # Create dialog
-        dialog = tk.Toplevel(self.root)
+    def _build_save_cat_dialog(self):
+        """Build the Save Extensions to Category dialog (once)."""
+        dialog = self._save_cat_dialog = tk.Toplevel(self.root)
         dialog.title("Save Extensions to Category")
         dialog.geometry("300x200")
         dialog.transient(self.root)
-        dialog.grab_set()
-
-        # Center
-        dialog.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - 300) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - 200) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
 
         frame = ttk.Frame(dialog, padding="10")
         frame.pack(fill=tk.BOTH, expand=True)
 
-        ttk.Label(frame, text=f"Extensions: {', '.join(sorted(new_exts))}").pack(anchor=tk.W, pady=(0, 10))
+        self._save_cat_label = ttk.Label(frame)
+        self._save_cat_label.pack(anchor=tk.W, pady=(0, 10))
         ttk.Label(frame, text="Select category to add to:").pack(anchor=tk.W)
 
-        # Listbox with all categories
-        listbox = tk.Listbox(frame, height=6, exportselection=False)
-        listbox.pack(fill=tk.X, pady=5)
+        # Listbox with all categories; repopulated on each open
+        self._save_cat_listbox = tk.Listbox(frame, height=6, exportselection=False)
+        self._save_cat_listbox.pack(fill=tk.X, pady=5)
 
-        # Add built-in categories
-        all_cats = [k for k in EXTENSION_PRESETS.keys() if k != "all"]
-        # Add custom categories
-        all_cats.extend(self.custom_categories.keys())
+        btn_row = ttk.Frame(frame)
+        btn_row.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(btn_row, text="Save", command=self._save_cat_save).pack(side=tk.LEFT)
+        ttk.Button(btn_row, text="Cancel",
+                   command=lambda: self._hide_dialog(dialog)).pack(side=tk.LEFT, padx=(10, 0))
 
-        for cat in all_cats:
-            listbox.insert(tk.END, cat.capitalize())
+    def _save_cat_save(self):
+        sel = self._save_cat_listbox.curselection()
+        if not sel:
+            return
+        cat_name = self._save_cat_cats[sel[0]]
+        new_exts = self._save_cat_exts
+
+        if cat_name in self.custom_categories:
+            # Add to custom category
+            self.custom_categories[cat_name] |= new_exts
+        else:
+            # Add to built-in category additions
+            if cat_name not in self.category_additions:
+                self.category_additions[cat_name] = set()
+            self.category_additions[cat_name] |= new_exts
+
+        self._invalidate_merged()
+        self.save_custom_categories()
+        self.custom_ext_var.set("")  # Clear entry
+        self.update_extension_checkboxes()
+        self._hide_dialog(self._save_cat_dialog)
 
-        def save_to_selected():
-            sel = listbox.curselection()
-            if not sel:
-                return
-            cat_name = all_cats[sel[0]]
+    def save_extensions_to_category(self):
+        """Open dialog to save extensions to a category."""
+        exts_text = self.custom_ext_var.get().strip()
+        if not exts_text:
+            return
 
-            if cat_name in self.custom_categories:
-                # Add to custom category
-                self.custom_categories[cat_name] |= new_exts
-            else:
-                # Add to built-in category additions
-                if cat_name not in self.category_additions:
-                    self.category_additions[cat_name] = set()
-                self.category_additions[cat_name] |= new_exts
+        new_exts = _parse_ext_list(exts_text)
+        if not new_exts:
+            return
 
-            self.save_custom_categories()
-            self.custom_ext_var.set("")  # Clear entry
-            self.update_extension_checkboxes()
-            dialog.destroy()
+        if self._save_cat_dialog is None:
+            self._build_save_cat_dialog()
 
-        btn_row = ttk.Frame(frame)
-        btn_row.pack(fill=tk.X, pady=(10, 0))
-        ttk.Button(btn_row, text="Save", command=save_to_selected).pack(side=tk.LEFT)
-        ttk.Button(btn_row, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=(10, 0))
+        # Built-in categories plus any custom ones, fresh each open
+        all_cats = [k for k in EXTENSION_PRESETS.keys() if k != "all"]
+        all_cats.extend(self.custom_categories.keys())
+
+        self._save_cat_exts = new_exts
+        self._save_cat_cats = all_cats
+        self._save_cat_label.config(text=f"Extensions: {', '.join(sorted(new_exts))}")
+        # One vararg insert is a single Tcl roundtrip for the whole list
+        self._save_cat_listbox.delete(0, tk.END)
+        self._save_cat_listbox.insert(tk.END, *(c.capitalize() for c in all_cats))
+
+        self._show_dialog(self._save_cat_dialog, 300, 200)
 
     def browse_directory(self):
+        # Rarely used, so the dialog module loads on first click
+        from tkinter import filedialog
+
         directory = filedialog.askdirectory(initialdir=self.dir_var.get())
         if directory:
             self.dir_var.set(directory)
 
+    def _on_organize_toggle(self):
+        """Attach the URL trace only while a folder preview is wanted."""
+        if self.organize_by_site_var.get():
+            if self._url_trace_name is None:
+                self._url_trace_name = self.url_var.trace_add(
+                    "write", lambda *args: self._schedule_preview_update())
+        elif self._url_trace_name is not None:
+            self.url_var.trace_remove("write", self._url_trace_name)
+            self._url_trace_name = None
+        self.update_folder_preview()
+
+    def _schedule_preview_update(self):
+        """
+        Debounce the URL trace: each keystroke cancels the previous
+        pending update, so a typing/paste burst costs one recompute
+        instead of one per character.
+        """
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(120, self._run_preview_update)
+
+    def _run_preview_update(self):
+        """Debounce timer fired: clear the pending id, then update."""
+        self._preview_after_id = None
+        self.update_folder_preview()
+
     def update_folder_preview(self):
         """Update the folder name preview based on current URL."""
         if not self.organize_by_site_var.get():
-            self.folder_preview_var.set("(disabled)")
+            self._last_preview_url = None
+            self._set_preview("(disabled)")
             return
 
         url = self.url_var.get().strip()
+
+        # Traces can fire without the text changing (cursor moves, focus
+        # writes on some Tk ports) - bail if the URL is the same
+        if url == self._last_preview_url:
+            return
+        self._last_preview_url = url
+
         if not url or url == "https://" or "://" not in url:
-            self.folder_preview_var.set("(enter URL above)")
+            self._set_preview("(enter URL above)")
             return
 
         folder_name = self.get_site_folder_name(url)
-        self.folder_preview_var.set(folder_name if folder_name else "(invalid URL)")
+        self._set_preview(folder_name if folder_name else "(invalid URL)")
 
-    def log(self, message):
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+    def _set_preview(self, text):
+        """Write the preview var only on change; set() always fires the
+        label redraw even for identical text."""
+        if self.folder_preview_var.get() != text:
+            self.folder_preview_var.set(text)
 
-    def clear_log(self):
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state=tk.DISABLED)
+    def _drain_log(self):
+        """Flush queued crawler log lines into the widget in one batch."""
+        batch = []
+        try:
+            while len(batch) < 200:
+                batch.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
 
-    def get_extensions(self):
-        exts = set()
+        self._log_bulk(batch)
+        self.root.after(100, self._drain_log)
 
-        # Get checked extensions from checkboxes
-        for ext, var in self.ext_checkboxes.items():
-            if var.get():
-                exts.add(ext)
+    def _log_bulk(self, lines):
+        """Append many log lines in one insert and one scroll."""
+        if not lines:
+            return
+        self._log_insert(tk.END, "\n".join(lines) + "\n")
 
-        # Add custom extensions
-        custom = self.custom_ext_var.get().strip()
-        if custom:
-            for ext in custom.split(","):
-                ext = ext.strip().lower()
-                if ext and not ext.startswith("."):
-                    ext = "." + ext
-                if ext:
-                    exts.add(ext)
+        # Trim the oldest lines when the scrollback grows too large -
+        # Text appends slow down with total content length. Messages
+        # can span several widget lines (the crawler batches progress
+        # into one multi-line message), so count embedded newlines
+        self._log_lines += sum(m.count("\n") + 1 for m in lines)
+        if self._log_lines > _LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{self._log_lines - _LOG_KEEP_LINES + 1}.0")
+            self._log_lines = _LOG_KEEP_LINES
 
-        return exts
+        self._log_see(tk.END)
 
-    def get_site_folder_name(self, url):
-        """
-        Extract a clean folder name from URL.
-        Example: www.abc.com/1/2/3/4.html -> abc-com-1-2-3-4
-        Archive: web.archive.org/web/20001018021550/http://arc.won.net/ -> arcwon
-        """
-        # Handle web.archive.org URLs specially
-        archive_match = re.match(r'https?://web\.archive\.org/web/\d+/(.+)', url)
-        if archive_match:
-            original_url = archive_match.group(1)
-            return self._get_archive_folder_name(original_url)
-
-        # Standard URL handling
-        parsed = urlparse(url)
-        domain = parsed.netloc
-        path = parsed.path
-
-        # Remove www. prefix
-        if domain.startswith("www."):
-            domain = domain[4:]
-
-        # Remove file extension from path
-        if path:
-            # Remove leading slash and file extension
-            path = path.lstrip("/")
-            path = re.sub(r'\.[a-zA-Z0-9]+$', '', path)
-
-        # Combine domain and path
-        full_name = domain
-        if path:
-            full_name = f"{domain}/{path}"
-
-        # Replace dots, slashes, and invalid chars with dashes
-        folder_name = re.sub(r'[./<>:"/\\|?*]+', '-', full_name)
-
-        # Clean up multiple dashes and trailing dashes
-        folder_name = re.sub(r'-+', '-', folder_name)
-        folder_name = folder_name.strip('-')
-
-        return folder_name
-
-    def _get_archive_folder_name(self, original_url):
-        """
-        Extract folder name from archived original URL.
-        Example: http://arc.won.net/guide/ -> arcwonguide
-        """
-        # Parse the original URL
-        if not original_url.startswith(('http://', 'https://')):
-            original_url = 'http://' + original_url
-
-        parsed = urlparse(original_url)
-        domain = parsed.netloc
-        path = parsed.path
-
-        # Remove www. prefix
-        if domain.startswith("www."):
-            domain = domain[4:]
+    def log(self, message):
+        """Queue a message for the next batched log flush."""
+        try:
+            self.log_queue.put_nowait(message)
+        except queue.Full:
+            pass  # Drop rather than block the UI
 
-        # Remove common TLDs
-        tlds = ['.com', '.net', '.org', '.edu', '.gov', '.co.uk', '.io', '.info']
-        for tld in tlds:
-            if domain.endswith(tld):
-                domain = domain[:-len(tld)]
-                break
+    def clear_log(self):
+        self.log_text.delete(1.0, tk.END)
+        self._log_lines = 0
 
-        # Clean path - remove leading/trailing slashes and file extensions
-        if path:
-            path = path.strip('/')
-            path = re.sub(r'\.[a-zA-Z0-9]+$', '', path)  # Remove file extension
+    def get_extensions(self):
+        # Checked extensions in one set build - a pure dict scan, no Tcl
+        # roundtrip per item
+        exts = {ext for ext, checked in self.ext_state.items() if checked}
 
-        # Combine domain and path
-        full_name = domain
-        if path:
-            full_name = f"{domain}/{path}"
+        # Add custom extensions typed into the entry
+        raw = self.custom_ext_var.get()
+        if raw:
+            exts |= _parse_ext_list(raw)
 
-        # Remove all dots, dashes, slashes - join as one word
-        folder_name = re.sub(r'[.\-_/]', '', full_name)
+        # Immutable and hashable: safe to share with the crawler and
+        # usable as a cache key downstream
+        return frozenset(exts)
 
-        return folder_name if folder_name else "archive"
+    def get_site_folder_name(self, url):
+        """Cached URL -> folder name mapping (see _site_folder_name)."""
+        return _site_folder_name(url)
 
     def start_crawl(self):
         url = self.url_var.get().strip()
@@ -668,21 +960,21 @@ class CrawlerGUI:
             site_folder = self.get_site_folder_name(url)
             out_dir = os.path.join(out_dir, site_folder)
 
+        # Typed Vars parse at the Tk layer; TclError only fires if the
+        # user typed garbage directly into a spinbox entry
         try:
-            max_pages = int(self.max_pages_var.get())
-        except ValueError:
+            max_pages = self.max_pages_var.get()
+        except tk.TclError:
             max_pages = DEFAULT_MAX_PAGES
 
         try:
-            max_depth = int(self.max_depth_var.get())
-            if max_depth == 0:
-                max_depth = None  # 0 means unlimited
-        except ValueError:
+            max_depth = self.max_depth_var.get() or None  # 0 means unlimited
+        except tk.TclError:
             max_depth = None
 
         try:
-            delay = float(self.delay_var.get())
-        except ValueError:
+            delay = self.delay_var.get()
+        except tk.TclError:
             delay = 0.0
 
         respect_robots = self.robots_var.get()
@@ -696,12 +988,15 @@ class CrawlerGUI:
             return
 
         self.is_crawling = True
+        self._stop_event.clear()
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
 
+        ext_list = sorted(extensions)
+
         self.log("=" * 50)
         self.log(f"URL: {url}")
-        self.log(f"Extensions: {', '.join(sorted(extensions)) if extensions else '(all)'}")
+        self.log(f"Extensions: {', '.join(ext_list) if ext_list else '(all)'}")
         self.log(f"Output: {out_dir}")
         self.log(f"Max pages: {max_pages}, Max depth: {max_depth if max_depth else 'unlimited'}")
         self.log(f"Delay: {delay}s, Robots: {respect_robots}, Dedup: {detect_duplicates}, Save HTML: {save_pages}")
@@ -716,18 +1011,8 @@ class CrawlerGUI:
         thread.start()
 
     def run_crawler(self, url, extensions, out_dir, max_pages, max_depth, delay, respect_robots, detect_duplicates, save_pages):
-        # Redirect print to log
-        class LogRedirector:
-            def __init__(self, gui):
-                self.gui = gui
-            def write(self, text):
-                if text.strip():
-                    self.gui.root.after(0, lambda: self.gui.log(text.strip()))
-            def flush(self):
-                pass
-
-        old_stdout = sys.stdout
-        sys.stdout = LogRedirector(self)
+        # Imported here so the window appears before requests/bs4 load
+        from crawler import crawl
 
         try:
             crawl(
@@ -739,12 +1024,13 @@ class CrawlerGUI:
                 delay=delay,
                 respect_robots=respect_robots,
                 detect_duplicates=detect_duplicates,
-                save_pages=save_pages
+                save_pages=save_pages,
+                stop_event=self._stop_event,
+                log_callback=self.log
             )
         except Exception as e:
             self.root.after(0, lambda: self.log(f"[ERROR] {e}"))
         finally:
-            sys.stdout = old_stdout
             self.root.after(0, self.crawl_finished)
 
     def crawl_finished(self):
@@ -753,11 +1039,17 @@ class CrawlerGUI:
         self.stop_btn.config(state=tk.DISABLED)
 
     def stop_crawl(self):
-        # Note: This is a simple implementation -
-        # full stop would require more complex thread handling
         self.log("[STOPPING] Crawl will stop after current page...")
+        self._stop_event.set()
         self.is_crawling = False
 
+    def _on_close(self):
+        # Flush any debounced category save before the window goes away
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_custom_categories_now()
+        self.root.destroy()
+
 
 def main():
     root = tk.Tk()